@@ -1,9 +1,10 @@
 import ast
+import hashlib
 import logging
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from ..models.edge import Edge, EdgeType
 from ..models.git import ChangedFiles
@@ -15,6 +16,18 @@ from .utils import find_python_files, get_changed_files, get_current_sha, get_fi
 logger = logging.getLogger("codex_aura")
 
 
+class FileResult(NamedTuple):
+    """Content-derived analysis of one file, reusable while its bytes are unchanged."""
+
+    docstring: Optional[str]
+    class_nodes: List[Node]
+    function_nodes: List[Node]
+    call_edges: List[Edge]
+    extend_edges: List[Edge]
+    # Import statements only; they are resolved against the current file set on every run
+    import_tree: ast.Module
+
+
 class PythonAnalyzer(BaseAnalyzer):
     """Analyzer for Python codebases that extracts import relationships and code structure.
 
@@ -32,6 +45,9 @@ class PythonAnalyzer(BaseAnalyzer):
             verbose: If True, enable verbose logging during analysis.
         """
         self.verbose = verbose
+        # One entry per relative path holding (content digest, result); a changed
+        # file replaces its entry, so the cache never outgrows the file set
+        self._file_cache: Dict[str, Tuple[bytes, FileResult]] = {}
 
     def analyze(self, repo_path: Path, user_id: str = None) -> Graph:
         """Perform complete analysis of a Python repository.
@@ -311,34 +327,64 @@ class PythonAnalyzer(BaseAnalyzer):
                 return [file_node], []
 
             # Read file content
-            try:
-                with file_path.open("r", encoding="utf-8") as f:
-                    content = f.read()
-            except UnicodeDecodeError as e:
-                logger.warning(f"Encoding error in {file_path}: {e}. Skipping file.")
-                file_node = self._create_file_node_only(file_path, repo_root)
-                return [file_node], []
+            content_bytes = file_path.read_bytes()
+            relative_file_path = str(file_path.relative_to(repo_root))
+            digest = hashlib.blake2b(content_bytes, digest_size=16).digest()
+            cached = self._file_cache.get(relative_file_path)
+            result = cached[1] if cached is not None and cached[0] == digest else None
 
-            # Parse AST
-            try:
-                tree = ast.parse(content, filename=str(file_path))
-            except SyntaxError as e:
-                logger.warning(f"Syntax error in {file_path}: {e}")
-                file_node = self._create_file_node_only(file_path, repo_root)
-                return [file_node], []
-            except Exception as e:
-                logger.warning(f"AST parsing failed for {file_path}: {e}")
-                file_node = self._create_file_node_only(file_path, repo_root)
-                return [file_node], []
+            if result is None:
+                try:
+                    content = content_bytes.decode("utf-8")
+                except UnicodeDecodeError as e:
+                    logger.warning(f"Encoding error in {file_path}: {e}. Skipping file.")
+                    file_node = self._create_file_node_only(file_path, repo_root)
+                    return [file_node], []
+                # Match text-mode reads, which translate newlines
+                if "\r" in content:
+                    content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+                # Parse AST
+                try:
+                    tree = ast.parse(content, filename=str(file_path))
+                except SyntaxError as e:
+                    logger.warning(f"Syntax error in {file_path}: {e}")
+                    file_node = self._create_file_node_only(file_path, repo_root)
+                    return [file_node], []
+                except Exception as e:
+                    logger.warning(f"AST parsing failed for {file_path}: {e}")
+                    file_node = self._create_file_node_only(file_path, repo_root)
+                    return [file_node], []
+
+                import_nodes = [
+                    node
+                    for node in ast.walk(tree)
+                    if isinstance(node, (ast.Import, ast.ImportFrom))
+                ]
+                result = FileResult(
+                    docstring=ast.get_docstring(tree),
+                    class_nodes=extract_classes(tree, relative_file_path),
+                    function_nodes=extract_functions(tree, relative_file_path),
+                    call_edges=extract_calls(tree, relative_file_path),
+                    extend_edges=extract_extends(tree, relative_file_path),
+                    import_tree=ast.Module(body=import_nodes, type_ignores=[]),
+                )
+                self._file_cache[relative_file_path] = (digest, result)
 
-            # Extract nodes and edges
-            relative_file_path = str(file_path.relative_to(repo_root))
-            file_node = parse_file_node(file_path, repo_root)
-            class_nodes = extract_classes(tree, relative_file_path)
-            function_nodes = extract_functions(tree, relative_file_path)
-            import_edges = extract_imports(tree, file_path, repo_root, all_files)
-            call_edges = extract_calls(tree, relative_file_path)
-            extend_edges = extract_extends(tree, relative_file_path)
+            # Extract nodes and edges; blame and import resolution depend on repo state
+            file_node = Node(
+                id=relative_file_path,
+                type="file",
+                name=file_path.name,
+                path=relative_file_path,
+                docstring=result.docstring,
+                blame=get_file_blame(file_path, repo_root),
+            )
+            class_nodes = [node.model_copy(deep=True) for node in result.class_nodes]
+            function_nodes = [node.model_copy(deep=True) for node in result.function_nodes]
+            import_edges = extract_imports(result.import_tree, file_path, repo_root, all_files)
+            call_edges = [edge.model_copy(deep=True) for edge in result.call_edges]
+            extend_edges = [edge.model_copy(deep=True) for edge in result.extend_edges]
 
             nodes = [file_node] + class_nodes + function_nodes
             edges = import_edges + call_edges + extend_edges
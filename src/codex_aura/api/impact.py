@@ -1,8 +1,10 @@
 """API endpoints for impact analysis."""
 
+from functools import lru_cache
+from typing import List, Literal
+
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List, Literal
 
 from ..impact_engine import ImpactEngine
 from ..storage.sqlite import SQLiteStorage
@@ -10,6 +12,12 @@ from ..storage.sqlite import SQLiteStorage
 router = APIRouter(prefix="/api/v1/impact", tags=["impact"])
 
 
+@lru_cache(maxsize=None)
+def get_storage() -> SQLiteStorage:
+    """Process-wide storage, so its pooled connections are reused across requests."""
+    return SQLiteStorage()
+
+
 class ImpactRequest(BaseModel):
     """Request model for impact analysis."""
 
@@ -103,8 +111,7 @@ async def analyze_pr_impact(request: PRImpactRequest):
     for PR discussion based on dependency analysis.
     """
     try:
-        storage = SQLiteStorage()
-        graph = storage.load_graph(request.repo_id)
+        graph = get_storage().load_graph(request.repo_id)
 
         if not graph:
             raise HTTPException(status_code=404, detail=f"Repository graph '{request.repo_id}' not found")
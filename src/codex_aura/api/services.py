@@ -1,8 +1,10 @@
 """API endpoints for Service Registry management."""
 
+from functools import lru_cache
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, Depends
+
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 from ..models.service import Service
@@ -49,8 +51,9 @@ class ServiceGraphResponse(BaseModel):
     edges: List[ServiceGraphEdge]
 
 
+@lru_cache(maxsize=None)
 def get_service_registry() -> ServiceRegistry:
-    """Dependency to get service registry."""
+    """Dependency to get the process-wide service registry and its lookup cache."""
     db = SQLiteStorage()
     return ServiceRegistry(db)
 
@@ -1,15 +1,22 @@
 """Plugin configuration management."""
 
+import copy
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class PluginConfig:
     """Configuration for plugins."""
 
+    # Parsed YAML keyed by resolved path, stored with the mtime it was parsed at
+    _parse_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or self._find_config_path()
         self._config = self._load_config()
@@ -32,8 +39,7 @@ class PluginConfig:
 
         # Load from YAML file if it exists
         if self.config_path.exists():
-            with self.config_path.open("r", encoding="utf-8") as f:
-                config = yaml.safe_load(f) or {}
+            config = self._parse_file(self.config_path)
 
         # Apply environment overrides
         config = self._apply_env_overrides(config)
@@ -43,6 +49,25 @@ class PluginConfig:
 
         return config
 
+    @classmethod
+    def _parse_file(cls, path: Path) -> Dict[str, Any]:
+        """Parse a YAML file, reusing the cached result while its mtime is unchanged."""
+        key = str(path.resolve())
+        mtime_ns = path.stat().st_mtime_ns
+        cached = cls._parse_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            parsed = cached[1]
+        else:
+            parsed = yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
+            cls._parse_cache[key] = (mtime_ns, parsed)
+        # Callers apply overrides in place, so never hand out the cached object
+        return copy.deepcopy(parsed)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached parse results."""
+        cls._parse_cache.clear()
+
     def _apply_env_overrides(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment variable overrides to configuration."""
         # Context plugin override
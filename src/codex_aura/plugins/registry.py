@@ -1,24 +1,40 @@
 """Plugin registry for managing context and impact plugins."""
 
+import copy
 import importlib
 import importlib.metadata
 import logging
-from typing import Any, Dict, List, Optional, Type
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Type
 
 logger = logging.getLogger("codex_aura")
 
 
 class PluginRegistry:
-    """Registry for managing plugins."""
+    """Registry for managing plugins.
+
+    Plugins registered with the decorators live in ``_context_plugins`` /
+    ``_impact_plugins``; plugins found through entry points are kept apart in
+    the append-only ``_discovered_*`` dicts. Lookups go through a read-only
+    merged view that is rebuilt only after one of them changes.
+    """
 
     _context_plugins: Dict[str, Type] = {}
     _impact_plugins: Dict[str, Type] = {}
+    _discovered_context: Dict[str, Type] = {}
+    _discovered_impact: Dict[str, Type] = {}
+    _discovered_groups: Set[str] = set()
+    _capabilities_cache: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+    # Bumped on every registration; merged views are cached against it
+    _version: int = 0
+    _views: Dict[str, Tuple[int, Mapping[str, Type]]] = {}
 
     @classmethod
     def register_context(cls, name: str):
         """Decorator to register a context plugin."""
         def decorator(plugin_class: Type) -> Type:
             cls._context_plugins[name] = plugin_class
+            cls._invalidate("context", name)
             logger.info(f"Registered context plugin: {name}")
             return plugin_class
         return decorator
@@ -28,55 +44,83 @@ class PluginRegistry:
         """Decorator to register an impact plugin."""
         def decorator(plugin_class: Type) -> Type:
             cls._impact_plugins[name] = plugin_class
+            cls._invalidate("impact", name)
             logger.info(f"Registered impact plugin: {name}")
             return plugin_class
         return decorator
 
+    @classmethod
+    def _invalidate(cls, kind: str, name: str) -> None:
+        """Drop cached views and capabilities after a plugin is (re)registered."""
+        cls._version += 1
+        cls._capabilities_cache.pop((kind, name), None)
+
+    @classmethod
+    def _view(cls, kind: str) -> Mapping[str, Type]:
+        """Read-only merge of registered and discovered plugins; registered ones win."""
+        cached = cls._views.get(kind)
+        if cached is not None and cached[0] == cls._version:
+            return cached[1]
+        if kind == "context":
+            merged = {**cls._discovered_context, **cls._context_plugins}
+        else:
+            merged = {**cls._discovered_impact, **cls._impact_plugins}
+        view = MappingProxyType(merged)
+        cls._views[kind] = (cls._version, view)
+        return view
+
     @classmethod
     def get_context_plugin(cls, name: str) -> Optional[Type]:
         """Get a context plugin by name."""
-        return cls._context_plugins.get(name)
+        return cls._view("context").get(name)
 
     @classmethod
     def get_impact_plugin(cls, name: str) -> Optional[Type]:
         """Get an impact plugin by name."""
-        return cls._impact_plugins.get(name)
+        return cls._view("impact").get(name)
 
     @classmethod
     def list_context_plugins(cls) -> List[str]:
         """List all registered context plugin names."""
-        return list(cls._context_plugins.keys())
+        return list(cls._view("context"))
 
     @classmethod
     def list_impact_plugins(cls) -> List[str]:
         """List all registered impact plugin names."""
-        return list(cls._impact_plugins.keys())
+        return list(cls._view("impact"))
+
+    @classmethod
+    def counts(cls) -> Tuple[int, int]:
+        """Return the number of registered (context, impact) plugins."""
+        return len(cls._view("context")), len(cls._view("impact"))
 
     @classmethod
     def get_context_plugin_capabilities(cls, name: str) -> Optional[Dict[str, Any]]:
         """Get capabilities of a context plugin."""
-        plugin_cls = cls.get_context_plugin(name)
-        if plugin_cls and hasattr(plugin_cls, 'get_capabilities'):
-            instance = plugin_cls()
-            return {
-                "name": getattr(instance, 'name', name),
-                "version": getattr(instance, 'version', 'unknown'),
-                "capabilities": instance.get_capabilities()
-            }
-        return None
+        return cls._cached_capabilities("context", name, cls.get_context_plugin(name))
 
     @classmethod
     def get_impact_plugin_capabilities(cls, name: str) -> Optional[Dict[str, Any]]:
         """Get capabilities of an impact plugin."""
-        plugin_cls = cls.get_impact_plugin(name)
-        if plugin_cls and hasattr(plugin_cls, 'get_capabilities'):
-            instance = plugin_cls()
-            return {
-                "name": getattr(instance, 'name', name),
-                "version": getattr(instance, 'version', 'unknown'),
-                "capabilities": instance.get_capabilities()
-            }
-        return None
+        return cls._cached_capabilities("impact", name, cls.get_impact_plugin(name))
+
+    @classmethod
+    def _cached_capabilities(
+        cls, kind: str, name: str, plugin_cls: Optional[Type]
+    ) -> Optional[Dict[str, Any]]:
+        """Instantiate a plugin for its capabilities once; later calls return a copy."""
+        key = (kind, name)
+        if key not in cls._capabilities_cache:
+            caps = None
+            if plugin_cls and hasattr(plugin_cls, 'get_capabilities'):
+                instance = plugin_cls()
+                caps = {
+                    "name": getattr(instance, 'name', name),
+                    "version": getattr(instance, 'version', 'unknown'),
+                    "capabilities": instance.get_capabilities()
+                }
+            cls._capabilities_cache[key] = caps
+        return copy.deepcopy(cls._capabilities_cache[key])
 
     @classmethod
     def get_all_capabilities(cls) -> Dict[str, Any]:
@@ -112,30 +156,37 @@ class PluginRegistry:
             raise
 
     @classmethod
-    def discover_plugins(cls):
-        """Discover and load plugins from entry points."""
-        # Discover context plugins
-        context_eps = importlib.metadata.entry_points(group="codex_aura.plugins.context")
-        for ep in context_eps:
-            try:
-                plugin_cls = ep.load()
-                if ep.name in cls._context_plugins:
-                    logger.warning(f"Context plugin '{ep.name}' already registered, skipping entry point")
-                    continue
-                cls._context_plugins[ep.name] = plugin_cls
-                logger.info(f"Discovered and registered context plugin: {ep.name} from {ep.value}")
-            except Exception as e:
-                logger.error(f"Failed to load context plugin '{ep.name}' from {ep.value}: {e}")
+    def discover_plugins(cls, force: bool = False):
+        """Discover and load plugins from entry points.
 
-        # Discover impact plugins
-        impact_eps = importlib.metadata.entry_points(group="codex_aura.plugins.impact")
-        for ep in impact_eps:
+        Each entry point group is scanned once per process; pass ``force=True``
+        to rescan, e.g. after installing a plugin distribution at runtime.
+        """
+        cls._discover_group("codex_aura.plugins.context", cls._discovered_context, "Context", force)
+        cls._discover_group("codex_aura.plugins.impact", cls._discovered_impact, "Impact", force)
+
+    @classmethod
+    def _discover_group(cls, group: str, plugins: Dict[str, Type], kind: str, force: bool) -> None:
+        """Register plugins from one entry point group unless it was already scanned."""
+        if group in cls._discovered_groups and not force:
+            return
+
+        for ep in importlib.metadata.entry_points(group=group):
             try:
                 plugin_cls = ep.load()
-                if ep.name in cls._impact_plugins:
-                    logger.warning(f"Impact plugin '{ep.name}' already registered, skipping entry point")
+                if ep.name in cls._view(kind.lower()):
+                    logger.warning(
+                        f"{kind} plugin '{ep.name}' already registered, skipping entry point"
+                    )
                     continue
-                cls._impact_plugins[ep.name] = plugin_cls
-                logger.info(f"Discovered and registered impact plugin: {ep.name} from {ep.value}")
+                plugins[ep.name] = plugin_cls
+                cls._invalidate(kind.lower(), ep.name)
+                logger.info(
+                    f"Discovered and registered {kind.lower()} plugin: {ep.name} from {ep.value}"
+                )
             except Exception as e:
-                logger.error(f"Failed to load impact plugin '{ep.name}' from {ep.value}: {e}")
\ No newline at end of file
+                logger.error(
+                    f"Failed to load {kind.lower()} plugin '{ep.name}' from {ep.value}: {e}"
+                )
+
+        cls._discovered_groups.add(group)
@@ -1,12 +1,13 @@
 """Snapshot service for creating graph snapshots."""
 
+import asyncio
 import logging
 import time
 from typing import List, Optional
 from uuid import UUID
 
-from ..models.node import Node, BlameInfo
 from ..models.edge import Edge, EdgeType
+from ..models.node import BlameInfo, Node
 from ..storage.neo4j_client import Neo4jClient
 from ..storage.postgres_snapshots import PostgresSnapshotStorage
 
@@ -42,13 +43,12 @@ class SnapshotService:
         logger.info(f"Starting snapshot creation for repo {repo_id}, SHA {sha}")
 
         try:
-            # Get all nodes for the repository from Neo4j
-            nodes = await self._get_nodes_for_repo(repo_id)
-            logger.info(f"Retrieved {len(nodes)} nodes for repo {repo_id}")
-
-            # Get all edges for the repository from Neo4j
-            edges = await self._get_edges_for_repo(repo_id)
-            logger.info(f"Retrieved {len(edges)} edges for repo {repo_id}")
+            # Fetch nodes and edges from Neo4j concurrently; the queries are independent
+            nodes, edges = await asyncio.gather(
+                self._get_nodes_for_repo(repo_id),
+                self._get_edges_for_repo(repo_id),
+            )
+            logger.info(f"Retrieved {len(nodes)} nodes and {len(edges)} edges for repo {repo_id}")
 
             # Create snapshot in PostgreSQL
             snapshot_id = await self.postgres_storage.create_snapshot(repo_id, sha, nodes, edges)
@@ -72,19 +72,20 @@ class SnapshotService:
         ORDER BY n.fqn
         """
 
-        results = await self.neo4j_client.execute_query(query, {"repo_id": repo_id})
         nodes = []
 
-        for record in results:
+        # Records are streamed so the raw result list is never held next to the nodes.
+        # They were written by us and validated then, so construct without re-validating
+        async for record in self.neo4j_client.stream_query(query, {"repo_id": repo_id}):
             node_data = dict(record["n"])
 
             # Convert blame data back to BlameInfo if present
             if node_data.get("blame"):
                 blame_dict = node_data["blame"]
-                node_data["blame"] = BlameInfo(**blame_dict)
+                node_data["blame"] = BlameInfo.model_construct(**blame_dict)
 
             # Create Node object
-            node = Node(**node_data)
+            node = Node.model_construct(**node_data)
             nodes.append(node)
 
         return nodes
@@ -98,11 +99,10 @@ class SnapshotService:
         ORDER BY a.fqn, b.fqn
         """
 
-        results = await self.neo4j_client.execute_query(query, {"repo_id": repo_id})
         edges = []
 
-        for record in results:
-            edge = Edge(
+        async for record in self.neo4j_client.stream_query(query, {"repo_id": repo_id}):
+            edge = Edge.model_construct(
                 source=record["source"],
                 target=record["target"],
                 type=EdgeType(record["edge_type"]),
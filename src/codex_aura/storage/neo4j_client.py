@@ -4,7 +4,7 @@ Provides async interface to Neo4j graph database.
 """
 
 import os
-from typing import Optional, Any, Dict, List
+from typing import AsyncIterator, Optional, Any, Dict, List
 from contextlib import asynccontextmanager
 from functools import lru_cache
 
@@ -98,6 +98,29 @@ class Neo4jClient:
             records = await result.fetch_all()
             return [dict(record) for record in records]
 
+    async def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a Cypher query and yield records as they arrive.
+
+        Unlike execute_query, records are never collected into a list, so
+        callers can convert large result sets one record at a time.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Yields:
+            Result records as dictionaries
+        """
+        async with self.session() as session:
+            result = await session.run(query, parameters or {})
+            async for record in result:
+                yield dict(record)
+
     async def execute_write_query(
         self,
         query: str,
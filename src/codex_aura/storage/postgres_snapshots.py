@@ -1,6 +1,7 @@
 """PostgreSQL storage for graph snapshots."""
 
 import asyncpg
+import orjson
 import uuid
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -10,6 +11,20 @@ from ..models.node import Node
 from ..models.edge import Edge
 from ..config.settings import settings
 
+# Column order of the node/edge SELECTs; rows are unpacked positionally in this order
+SNAPSHOT_NODE_COLUMNS = ("node_id", "node_type", "name", "path", "lines", "docstring", "blame")
+SNAPSHOT_EDGE_COLUMNS = ("source_id", "target_id", "edge_type", "line_number")
+
+
+def _encode_json(value: Any) -> str:
+    """Serialize a value for a JSONB parameter."""
+    return orjson.dumps(value).decode()
+
+
+def _decode_json(value: Optional[str]) -> Any:
+    """Deserialize a JSONB column, which asyncpg returns as text."""
+    return orjson.loads(value) if value is not None else None
+
 
 class GraphSnapshot:
     """Represents a graph snapshot."""
@@ -157,13 +172,14 @@ class PostgresSnapshotStorage:
                 if nodes:
                     node_records = []
                     for node in nodes:
+                        # asyncpg takes JSONB parameters as text, so blame is serialized here
                         blame_data = None
                         if node.blame:
-                            blame_data = {
+                            blame_data = _encode_json({
                                 'primary_author': node.blame.primary_author,
                                 'contributors': node.blame.contributors,
                                 'author_distribution': dict(node.blame.author_distribution)
-                            }
+                            })
 
                         node_records.append((
                             snapshot_id,
@@ -241,36 +257,35 @@ class PostgresSnapshotStorage:
             return None
 
     async def get_snapshot_nodes(self, snapshot_id: str) -> List[Dict[str, Any]]:
-        """Get all nodes for a snapshot."""
+        """Get all nodes for a snapshot.
+
+        Blame is decoded back to a dict; consumers can convert it to BlameInfo.
+        """
         async with self.connection() as conn:
-            rows = await conn.fetch("""
-                SELECT node_id, node_type, name, path, lines, docstring, blame
+            rows = await conn.fetch(f"""
+                SELECT {', '.join(SNAPSHOT_NODE_COLUMNS)}
                 FROM snapshot_nodes
                 WHERE snapshot_id = $1
                 ORDER BY node_id
             """, snapshot_id)
 
-            nodes = []
-            for row in rows:
-                node_data = dict(row)
-                # Convert blame JSON back to object if needed
-                if node_data['blame']:
-                    # For now, return as dict - consumer can convert to BlameInfo if needed
-                    pass
-                nodes.append(node_data)
+            # Records are read positionally; zip avoids a per-row key lookup
+            nodes = [dict(zip(SNAPSHOT_NODE_COLUMNS, row)) for row in rows]
+            for node in nodes:
+                node["blame"] = _decode_json(node["blame"])
             return nodes
 
     async def get_snapshot_edges(self, snapshot_id: str) -> List[Dict[str, Any]]:
         """Get all edges for a snapshot."""
         async with self.connection() as conn:
-            rows = await conn.fetch("""
-                SELECT source_id, target_id, edge_type, line_number
+            rows = await conn.fetch(f"""
+                SELECT {', '.join(SNAPSHOT_EDGE_COLUMNS)}
                 FROM snapshot_edges
                 WHERE snapshot_id = $1
                 ORDER BY source_id, target_id
             """, snapshot_id)
 
-            return [dict(row) for row in rows]
+            return [dict(zip(SNAPSHOT_EDGE_COLUMNS, row)) for row in rows]
 
     async def delete_snapshot(self, snapshot_id: str):
         """Delete a snapshot and all its data."""
@@ -1,6 +1,7 @@
 """Service Registry management."""
 
-from typing import List, Optional
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from ..models.service import Service
@@ -10,8 +11,20 @@ from .sqlite import SQLiteStorage
 class ServiceRegistry:
     """Manages the Service Registry."""
 
+    # Seconds a repo_id lookup (including a miss) is served from memory
+    _TTL = 20.0
+
     def __init__(self, db: SQLiteStorage):
         self.db = db
+        self._cache: Dict[str, Tuple[float, Optional[Service]]] = {}
+
+    def _invalidate(self, service_id: str, repo_id: Optional[str] = None) -> None:
+        """Drop cached lookups for a repo_id and any entry holding the service."""
+        if repo_id is not None:
+            self._cache.pop(repo_id, None)
+        for key, (_, cached) in list(self._cache.items()):
+            if cached is not None and str(cached.service_id) == service_id:
+                self._cache.pop(key, None)
 
     def register_service(self, service: Service) -> None:
         """Register or update a service in the registry.
@@ -20,6 +33,7 @@ class ServiceRegistry:
             service: Service to register
         """
         self.db.save_service(service)
+        self._invalidate(str(service.service_id), str(service.repo_id))
 
     def get_service_by_repo_id(self, repo_id: str) -> Optional[Service]:
         """Get service by repository ID.
@@ -30,7 +44,13 @@ class ServiceRegistry:
         Returns:
             Service object or None if not found
         """
-        return self.db.get_service_by_repo_id(repo_id)
+        now = monotonic()
+        hit = self._cache.get(repo_id)
+        if hit is None or now - hit[0] >= self._TTL:
+            hit = (now, self.db.get_service_by_repo_id(repo_id))
+            self._cache[repo_id] = hit
+        # Hand out copies so callers can't mutate the cached entry
+        return hit[1].model_copy() if hit[1] is not None else None
 
     def get_service_by_id(self, service_id: str) -> Optional[Service]:
         """Get service by service ID.
@@ -60,7 +80,9 @@ class ServiceRegistry:
         Returns:
             True if deleted, False if not found
         """
-        return self.db.delete_service(service_id)
+        deleted = self.db.delete_service(service_id)
+        self._invalidate(service_id)
+        return deleted
 
     def get_service_name_by_repo_id(self, repo_id: str) -> Optional[str]:
         """Get service name by repository ID.
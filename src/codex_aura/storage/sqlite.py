@@ -2,10 +2,13 @@
 
 import json
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Iterator, List, Optional, Set, Tuple
 from collections import deque
+from uuid import uuid4
 
 from ..models.graph import Graph, load_graph, save_graph
 from ..models.edge import Edge, EdgeType
@@ -18,15 +21,113 @@ class SQLiteStorage:
         """Initialize SQLite storage.
 
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, ":memory:", or a ``file:``
+                URI such as ``file:name?mode=memory&cache=shared``
         """
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(exist_ok=True)
+        self.db_path = str(db_path)
+        self._in_memory = self.db_path == ":memory:" or (
+            self.db_path.startswith("file:") and "mode=memory" in self.db_path
+        )
+        if self.db_path == ":memory:":
+            # A private shared-cache name so every connection reaches the same database
+            self._target = f"file:codex_aura_{uuid4().hex}?mode=memory&cache=shared"
+        else:
+            self._target = self.db_path
+        self._uri = self._target.startswith("file:")
+        if not self._uri:
+            Path(self.db_path).parent.mkdir(exist_ok=True)
+        # Connections are opened once and reused: one per thread for files, a
+        # single shared one for ":memory:" so every call sees the same database
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._memory_conn: Optional[sqlite3.Connection] = None
+        self._memory_lock = threading.RLock()
+        if self.db_path == ":memory:":
+            self._memory_conn = self._open_connection(check_same_thread=False)
         self._init_db()
 
+    def connect(self, **kwargs) -> sqlite3.Connection:
+        """Open a new connection to this storage's database, tuned like the pooled ones.
+
+        The caller owns the connection and must close it. Use this rather than
+        ``sqlite3.connect(storage.db_path)``, which cannot reach ``file:`` URIs
+        or in-memory databases.
+        """
+        conn = sqlite3.connect(self._target, uri=self._uri, **kwargs)
+        if self._in_memory:
+            self._fast_mode(conn)
+        else:
+            self._file_mode(conn)
+        return conn
+
+    def _open_connection(self, **kwargs) -> sqlite3.Connection:
+        """Open a new connection and track it so close() can release it."""
+        conn = self.connect(**kwargs)
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    @staticmethod
+    def _fast_mode(conn: sqlite3.Connection) -> None:
+        """Drop durability guarantees that are meaningless for in-memory databases."""
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+    @staticmethod
+    def _file_mode(conn: sqlite3.Connection) -> None:
+        """Use WAL with memory-mapped reads for on-disk databases."""
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield the pooled connection for the calling thread inside a transaction.
+
+        The transaction commits on success and rolls back on error; the
+        connection stays open. The shared ":memory:" connection is used by one
+        thread at a time.
+        """
+        if self._memory_conn is not None:
+            with self._memory_lock, self._memory_conn:
+                yield self._memory_conn
+            return
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Only this thread uses it, but close() may run on any thread
+            conn = self._open_connection(check_same_thread=False)
+            self._local.conn = conn
+        with conn:
+            yield conn
+
+    def close(self) -> None:
+        """Close every pooled connection, re-raising the first failure after all are tried."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        error: Optional[sqlite3.Error] = None
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                error = error or e
+        self._local = threading.local()
+        self._memory_conn = None
+        if error is not None:
+            raise error
+
+    def __enter__(self) -> "SQLiteStorage":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def _init_db(self):
         """Initialize database tables and run migrations."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             # Create migrations table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS migrations (
@@ -98,7 +199,7 @@ class SQLiteStorage:
         # Save graph data as JSON
         graph_json = graph.model_dump_json()
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO graphs
                 (id, repo_name, repo_path, sha, created_at, graph_data)
@@ -111,7 +212,6 @@ class SQLiteStorage:
                 graph.generated_at.isoformat(),
                 graph_json
             ))
-            conn.commit()
 
     def load_graph(self, graph_id: str) -> Optional[Graph]:
         """Load a graph from storage.
@@ -122,7 +222,7 @@ class SQLiteStorage:
         Returns:
             The loaded graph or None if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT graph_data FROM graphs WHERE id = ?
             """, (graph_id,))
@@ -141,39 +241,34 @@ class SQLiteStorage:
         Returns:
             List of graph information dictionaries
         """
-        with sqlite3.connect(self.db_path) as conn:
+        # Stats are read straight out of the stored JSON by position, so listing
+        # never parses or validates whole graphs
+        columns = """
+            SELECT id, repo_name, repo_path, sha, created_at,
+                   json_extract(graph_data, '$.stats.total_nodes'),
+                   json_extract(graph_data, '$.stats.total_edges')
+            FROM graphs
+        """
+        with self._connection() as conn:
             if repo_path:
-                cursor = conn.execute("""
-                    SELECT id, repo_name, repo_path, sha, created_at, graph_data
-                    FROM graphs
-                    WHERE repo_path = ?
-                    ORDER BY created_at DESC
-                """, (repo_path,))
+                rows = conn.execute(
+                    columns + "WHERE repo_path = ? ORDER BY created_at DESC", (repo_path,)
+                ).fetchall()
             else:
-                cursor = conn.execute("""
-                    SELECT id, repo_name, repo_path, sha, created_at, graph_data
-                    FROM graphs
-                    ORDER BY created_at DESC
-                """)
-
-            graphs = []
-            for row in cursor.fetchall():
-                graph_id, repo_name, repo_path, sha, created_at_str, graph_data = row
-
-                # Parse graph data to get stats
-                graph = Graph.model_validate_json(graph_data)
-
-                graphs.append({
-                    "id": graph_id,
-                    "repo_name": repo_name,
-                    "repo_path": repo_path,
-                    "sha": sha,
-                    "created_at": datetime.fromisoformat(created_at_str),
-                    "node_count": graph.stats.total_nodes,
-                    "edge_count": graph.stats.total_edges
-                })
-
-            return graphs
+                rows = conn.execute(columns + "ORDER BY created_at DESC").fetchall()
+
+        return [
+            {
+                "id": row[0],
+                "repo_name": row[1],
+                "repo_path": row[2],
+                "sha": row[3],
+                "created_at": datetime.fromisoformat(row[4]),
+                "node_count": row[5],
+                "edge_count": row[6]
+            }
+            for row in rows
+        ]
 
     def delete_graph(self, graph_id: str) -> bool:
         """Delete a graph from storage.
@@ -184,7 +279,7 @@ class SQLiteStorage:
         Returns:
             True if deleted, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("DELETE FROM graphs WHERE id = ?", (graph_id,))
             conn.commit()
             return cursor.rowcount > 0
@@ -247,7 +342,11 @@ class SQLiteStorage:
 
     def query_dependencies(self, graph_id: str, node_id: str, direction: str = "both",
                           max_depth: int = 2, edge_types: Optional[List[str]] = None) -> Tuple[Set[str], Set[Tuple[str, str, str]]]:
-        """Query dependencies for a node using BFS traversal.
+        """Query dependencies for a node with a recursive CTE over the stored edges.
+
+        The traversal runs inside SQLite on the graph's JSON edge list, so the
+        graph is never loaded into Python models. Results match
+        ``_traverse_dependencies``.
 
         Args:
             graph_id: Graph identifier
@@ -259,11 +358,55 @@ class SQLiteStorage:
         Returns:
             Tuple of (node_ids, edges) where edges are (source, target, type) tuples
         """
-        graph = self.load_graph(graph_id)
-        if not graph:
-            raise ValueError(f"Graph {graph_id} not found")
+        params = {
+            "graph_id": graph_id,
+            "node_id": node_id,
+            "max_depth": max_depth,
+            "outgoing": direction in ("outgoing", "both"),
+            "incoming": direction in ("incoming", "both"),
+        }
+        type_filter = ""
+        if edge_types:
+            params.update({f"type{i}": t for i, t in enumerate(edge_types)})
+            placeholders = ", ".join(f":type{i}" for i in range(len(edge_types)))
+            type_filter = f"AND json_extract(value, '$.type') IN ({placeholders})"
+
+        with self._connection() as conn:
+            if conn.execute("SELECT 1 FROM graphs WHERE id = ?", (graph_id,)).fetchone() is None:
+                raise ValueError(f"Graph {graph_id} not found")
+
+            rows = conn.execute(f"""
+                WITH RECURSIVE
+                edge(source, target, type) AS (
+                    SELECT json_extract(value, '$.source'), json_extract(value, '$.target'),
+                           json_extract(value, '$.type')
+                    FROM graphs, json_each(graphs.graph_data, '$.edges')
+                    WHERE graphs.id = :graph_id {type_filter}
+                ),
+                step(src, dst) AS (
+                    SELECT source, target FROM edge WHERE :outgoing
+                    UNION ALL
+                    SELECT target, source FROM edge WHERE :incoming
+                ),
+                reach(node, depth) AS (
+                    SELECT :node_id, 0
+                    UNION
+                    SELECT step.dst, reach.depth + 1
+                    FROM reach JOIN step ON step.src = reach.node
+                    WHERE reach.depth < :max_depth
+                ),
+                frontier(node) AS (
+                    SELECT node FROM reach GROUP BY node HAVING MIN(depth) < :max_depth
+                )
+                SELECT DISTINCT node, NULL, NULL FROM reach
+                UNION ALL
+                SELECT DISTINCT source, target, type FROM edge
+                WHERE (:outgoing AND source IN frontier) OR (:incoming AND target IN frontier)
+            """, params).fetchall()
 
-        return self._traverse_dependencies(graph, node_id, max_depth, direction, edge_types)
+        node_ids = {source for source, target, _ in rows if target is None}
+        edges = {row for row in rows if row[1] is not None}
+        return node_ids, edges
 
     def _traverse_dependencies(self, graph: Graph, start_node_id: str, max_depth: int,
                               direction: str, edge_types: Optional[List[str]] = None) -> Tuple[Set[str], Set[Tuple[str, str, str]]]:
@@ -314,7 +457,7 @@ class SQLiteStorage:
 
         # Migration 2: Add services table
         if current_version < 2:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 # Create services table
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS services (
@@ -337,21 +480,32 @@ class SQLiteStorage:
 
             self._apply_migration(2, "add_services_table")
 
+        # Migration 3: Composite indexes for list_graphs filtering and ordering
+        if current_version < 3:
+            with self._connection() as conn:
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_graphs_repo_path_created
+                    ON graphs(repo_path, created_at)
+                """)
+                conn.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_graphs_created
+                    ON graphs(created_at)
+                """)
+
+            self._apply_migration(3, "add_indexes")
+
         # Future migrations can be added here
-        # if current_version < 3:
-        #     # Add new table/index
-        #     self._apply_migration(3, "add_indexes")
 
     def _get_schema_version(self) -> int:
         """Get current schema version."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("SELECT MAX(version) FROM migrations")
             result = cursor.fetchone()
             return result[0] if result and result[0] else 0
 
     def _apply_migration(self, version: int, name: str):
         """Apply a migration."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute(
                 "INSERT INTO migrations (version, name, applied_at) VALUES (?, ?, ?)",
                 (version, name, datetime.now().isoformat())
@@ -359,8 +513,8 @@ class SQLiteStorage:
             conn.commit()
 
     def _get_connection(self):
-        """Get database connection (for testing)."""
-        return sqlite3.connect(self.db_path)
+        """Get the pooled database connection context (for testing)."""
+        return self._connection()
 
     async def insert_usage_event(
         self,
@@ -377,7 +531,7 @@ class SQLiteStorage:
             tokens_used: Number of tokens consumed
             timestamp: Event timestamp
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 INSERT INTO usage_events
                 (user_id, endpoint, tokens_used, timestamp)
@@ -396,7 +550,7 @@ class SQLiteStorage:
         Args:
             service: Service object to save
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO services
                 (service_id, name, repo_id, description, updated_at)
@@ -421,7 +575,7 @@ class SQLiteStorage:
         """
         from ..models.service import Service
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT service_id, name, repo_id, description
                 FROM services WHERE repo_id = ?
@@ -448,7 +602,7 @@ class SQLiteStorage:
         """
         from ..models.service import Service
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT service_id, name, repo_id, description
                 FROM services WHERE service_id = ?
@@ -473,7 +627,7 @@ class SQLiteStorage:
         from ..models.service import Service
 
         services = []
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT service_id, name, repo_id, description
                 FROM services ORDER BY name
@@ -497,7 +651,7 @@ class SQLiteStorage:
         Returns:
             True if deleted, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute("DELETE FROM services WHERE service_id = ?", (service_id,))
             conn.commit()
             return cursor.rowcount > 0
\ No newline at end of file
@@ -4,7 +4,7 @@ import os
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import List, Optional, Dict
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, closing
 
 from ..models.graph import Graph
 from ..models.node import Node
@@ -179,7 +179,7 @@ class SQLiteGraphTransaction:
 
     async def __aenter__(self):
         import sqlite3
-        self._conn = sqlite3.connect(self.storage.db_path)
+        self._conn = self.storage.connect()
         self._conn.row_factory = sqlite3.Row
         self._cursor = self._conn.cursor()
         return self
@@ -293,8 +293,7 @@ class SQLiteStorageBackend(GraphStorage):
 
     def _ensure_incremental_tables(self):
         """Ensure tables for incremental updates exist."""
-        import sqlite3
-        with sqlite3.connect(self.storage.db_path) as conn:
+        with closing(self.storage.connect()) as conn:
             # Create nodes table for incremental updates
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS nodes (
@@ -0,0 +1,33 @@
+"""Minimal async stand-ins for storage clients in performance tests.
+
+Unlike AsyncMock they keep no call history beyond the last call, so large
+payloads are not retained by mock bookkeeping.
+"""
+
+
+class StubNeo4j:
+    """Neo4j client stub streaming node and edge records from fixed lists."""
+
+    def __init__(self, nodes=(), edges=()):
+        self.nodes = nodes
+        self.edges = edges
+        self.call_count = 0
+
+    async def stream_query(self, query, params=None):
+        self.call_count += 1
+        for record in self.nodes if "MATCH (n:Node)" in query else self.edges:
+            yield record
+
+
+class StubPG:
+    """PostgreSQL snapshot storage stub remembering only its last call."""
+
+    def __init__(self, snapshot_id="test-snapshot-id"):
+        self.snapshot_id = snapshot_id
+        self.call_count = 0
+        self.last_call = None
+
+    async def create_snapshot(self, repo_id, sha, nodes, edges):
+        self.call_count += 1
+        self.last_call = (repo_id, sha, nodes, edges)
+        return self.snapshot_id
@@ -1,7 +1,62 @@
-import pytest
-import tempfile
+import asyncio
 import os
+import tempfile
 from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+# Test modules whose module-scoped fixtures should be built on a single xdist worker
+XDIST_GROUPS = {
+    "test_pipeline.py": "pipeline",
+    "test_plugins.py": "plugins",
+    "test_postgres_snapshots.py": "postgres",
+    "test_real_projects.py": "real",
+}
+
+
+def _skip_real_projects() -> bool:
+    """Real-project tests clone from GitHub, so skip them in CI or when asked to."""
+    ci = os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS")
+    opted_out = os.environ.get("SKIP_REAL_PROJECT_TESTS", "").lower() in ("1", "true", "yes")
+    return ci is not None or opted_out
+
+
+def pytest_addoption(parser):
+    """Register opt-in flags for expensive tests."""
+    parser.addoption(
+        "--run-huge", action="store_true", default=False,
+        help="run the synthetic 100K LOC performance test"
+    )
+    parser.addoption(
+        "--subprocess", action="store_true", default=False,
+        help="run real-project CLI analysis in a fresh interpreter instead of in-process"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Reject duplicate node ids, skip unrunnable real-project tests and tag xdist groups.
+
+    Grouped modules are kept together under ``pytest -n auto --dist=loadgroup``.
+    """
+    seen = set()
+    duplicates = set()
+    for item in items:
+        if item.nodeid in seen:
+            duplicates.add(item.nodeid)
+        seen.add(item.nodeid)
+    if duplicates:
+        raise pytest.UsageError(f"Tests collected more than once: {', '.join(sorted(duplicates))}")
+
+    skip_real_projects = _skip_real_projects()
+    for item in items:
+        if skip_real_projects and "real_project" in item.keywords:
+            item.add_marker(pytest.mark.skip(
+                reason="Real project tests skipped in CI or via SKIP_REAL_PROJECT_TESTS env var"
+            ))
+        group = XDIST_GROUPS.get(item.path.name)
+        if group:
+            item.add_marker(pytest.mark.xdist_group(group))
 
 
 @pytest.fixture
@@ -16,4 +71,53 @@ def sample_file(temp_dir):
     """Create a sample file for testing."""
     file_path = temp_dir / "sample.txt"
     file_path.write_text("Hello, World!")
-    return file_path
\ No newline at end of file
+    return file_path
+
+
+def _uuid_batch(n: int) -> list:
+    """Return n random version-4 UUIDs drawn from a single os.urandom call."""
+    raw = os.urandom(16 * n)
+    return [UUID(bytes=raw[i * 16:(i + 1) * 16], version=4) for i in range(n)]
+
+
+@pytest.fixture(scope="session")
+def uuid_batch():
+    """Factory for batches of random UUIDs, cheaper than repeated uuid4() calls."""
+    return _uuid_batch
+
+
+@pytest.fixture(scope="session")
+def shared_sqlite_storage():
+    """One migrated in-memory SQLiteStorage reused by the whole session."""
+    from src.codex_aura.storage.sqlite import SQLiteStorage
+
+    storage = SQLiteStorage(":memory:")
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def db(shared_sqlite_storage):
+    """The shared in-memory storage, emptied after each test.
+
+    Storage methods commit their own transactions, so rows are deleted on
+    teardown instead of rolling back to a savepoint.
+    """
+    yield shared_sqlite_storage
+    with shared_sqlite_storage._get_connection() as conn:
+        tables = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT IN ('migrations', 'sqlite_sequence')"
+        ).fetchall()
+        for (table,) in tables:
+            conn.execute(f'DELETE FROM "{table}"')
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed, else the stock asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
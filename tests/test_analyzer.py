@@ -203,4 +203,36 @@ class TestSyntaxErrorHandling:
 
         # Should create file node despite encoding error
         assert len(nodes) == 1
-        assert nodes[0].type == "file"
\ No newline at end of file
+        assert nodes[0].type == "file"
+
+
+class TestFileCache:
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        """Test that analyzing identical content reuses the cached extraction."""
+        file_path = tmp_path / "module.py"
+        file_path.write_text("class Foo:\n    def bar(self):\n        pass\n")
+
+        analyzer = PythonAnalyzer()
+        first_nodes, first_edges = analyzer.analyze_file(file_path, tmp_path, {file_path})
+
+        with patch("codex_aura.analyzer.python.ast.parse") as mock_parse:
+            nodes, edges = analyzer.analyze_file(file_path, tmp_path, {file_path})
+            mock_parse.assert_not_called()
+
+        assert nodes == first_nodes
+        assert edges == first_edges
+        assert nodes[1] is not first_nodes[1]
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        """Test that editing a file invalidates its cached extraction."""
+        file_path = tmp_path / "module.py"
+        file_path.write_text("def foo():\n    pass\n")
+
+        analyzer = PythonAnalyzer()
+        analyzer.analyze_file(file_path, tmp_path, {file_path})
+
+        file_path.write_text("def foo():\n    pass\n\n\ndef bar():\n    pass\n")
+        nodes, _ = analyzer.analyze_file(file_path, tmp_path, {file_path})
+
+        assert [node.name for node in nodes if node.type == "function"] == ["foo", "bar"]
+        assert len(analyzer._file_cache) == 1
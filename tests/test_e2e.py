@@ -11,6 +11,21 @@ import signal
 import psutil
 
 
+def wait_for_server(base_url: str, timeout: float = 10.0) -> None:
+    """Poll the health endpoint with capped exponential backoff until it answers 200."""
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(f"{base_url}/health", timeout=0.5).status_code == 200:
+                return
+        except requests.exceptions.RequestException:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.2)
+    raise TimeoutError(f"Server at {base_url} not ready after {timeout}s")
+
+
 @pytest.fixture
 def flask_mini_repo():
     """Path to flask_mini example repository."""
@@ -44,13 +59,9 @@ def test_cli_analyze_api_query_integration(flask_mini_repo, tmp_path):
         )
 
         # Wait for server to start
-        time.sleep(3)
-
-        # Verify server is running
         try:
-            response = requests.get("http://127.0.0.1:8001/health", timeout=5)
-            assert response.status_code == 200
-        except requests.exceptions.RequestException:
+            wait_for_server("http://127.0.0.1:8001")
+        except TimeoutError:
             pytest.fail("API server failed to start")
 
         # Run CLI analyze - outputs JSON by default
@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from codex_aura.context.pipeline import UnifiedContextPipeline, PipelineConfig
 from codex_aura.models.node import Node
@@ -12,42 +13,67 @@ from codex_aura.api.models.context import ContextResponse, ContextStats
 class TestUnifiedContextPipeline:
     """Test the UnifiedContextPipeline class."""
 
-    @pytest.fixture
-    def mock_embedding_service(self):
+    @pytest.fixture(scope="module")
+    def mock_defaults(self):
+        """Default child mocks and their return values, keyed by service.
+
+        Every attribute a test reassigns on a shared mock must be listed here so
+        that it is restored afterwards.
+        """
+        node = Node(
+            id="func_a", type="function", name="func_a", path="test.py", content="def func_a(): pass"
+        )
+        return {
+            "embedding": {
+                "embed_code": (AsyncMock(), [0.1, 0.2, 0.3]),
+            },
+            "graph": {
+                "get_dependencies": (AsyncMock(), [("func_a", 1), ("func_b", 2)]),
+                "get_dependents": (AsyncMock(), []),
+                "get_node": (AsyncMock(), node),
+                "get_nodes_in_file": (AsyncMock(), [node]),
+                "find_nodes_by_glob": (AsyncMock(), [node]),
+                "get_node_at_line": (AsyncMock(), node),
+            },
+            "counter": {
+                "count_node": (MagicMock(), 100),
+            },
+        }
+
+    @staticmethod
+    def _restore(mock, defaults):
+        """Clear a shared mock and re-attach its default children and return values."""
+        mock.reset_mock(return_value=True, side_effect=True)
+        for name, (child, return_value) in defaults.items():
+            child.reset_mock(return_value=True, side_effect=True)
+            child.return_value = return_value
+            setattr(mock, name, child)
+        return mock
+
+    @pytest.fixture(scope="module")
+    def mock_embedding_service(self, mock_defaults):
         """Mock embedding service."""
-        service = MagicMock()
-        service.embed_code = AsyncMock(return_value=[0.1, 0.2, 0.3])
-        return service
+        return self._restore(MagicMock(), mock_defaults["embedding"])
 
-    @pytest.fixture
-    def mock_graph_storage(self):
+    @pytest.fixture(scope="module")
+    def mock_graph_storage(self, mock_defaults):
         """Mock graph storage."""
-        storage = MagicMock()
-        storage.get_dependencies = AsyncMock(return_value=[("func_a", 1), ("func_b", 2)])
-        storage.get_node = AsyncMock(return_value=Node(
-            id="func_a",
-            type="function",
-            name="func_a",
-            path="test.py",
-            content="def func_a(): pass"
-        ))
-        storage.get_nodes_in_file = AsyncMock(return_value=[
-            Node(id="func_a", type="function", name="func_a", path="test.py", content="def func_a(): pass")
-        ])
-        storage.find_nodes_by_glob = AsyncMock(return_value=[
-            Node(id="func_a", type="function", name="func_a", path="test.py", content="def func_a(): pass")
-        ])
-        storage.get_node_at_line = AsyncMock(return_value=Node(
-            id="func_a", type="function", name="func_a", path="test.py", content="def func_a(): pass"
-        ))
-        return storage
+        return self._restore(MagicMock(), mock_defaults["graph"])
 
-    @pytest.fixture
-    def mock_token_counter(self):
+    @pytest.fixture(scope="module")
+    def mock_token_counter(self, mock_defaults):
         """Mock token counter."""
-        counter = MagicMock()
-        counter.count_node = MagicMock(return_value=100)
-        return counter
+        return self._restore(MagicMock(), mock_defaults["counter"])
+
+    @pytest.fixture(autouse=True)
+    def reset_shared_mocks(
+        self, mock_defaults, mock_embedding_service, mock_graph_storage, mock_token_counter
+    ):
+        """Undo per-test rewiring, return values and call history on the module-scoped mocks."""
+        yield
+        self._restore(mock_embedding_service, mock_defaults["embedding"])
+        self._restore(mock_graph_storage, mock_defaults["graph"])
+        self._restore(mock_token_counter, mock_defaults["counter"])
 
     @pytest.fixture
     def pipeline(self, mock_embedding_service, mock_graph_storage, mock_token_counter):
@@ -58,7 +84,7 @@ class TestUnifiedContextPipeline:
             token_counter=mock_token_counter
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_search_results(self):
         """Sample search results."""
         return [
@@ -76,7 +102,7 @@ class TestUnifiedContextPipeline:
             )
         ]
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_nodes(self):
         """Sample nodes."""
         return [
@@ -95,15 +121,15 @@ class TestUnifiedContextPipeline:
         # Mock the internal methods
         pipeline._semantic_search = AsyncMock(return_value=sample_search_results)
         pipeline._graph_expansion = AsyncMock(return_value=sample_nodes)
-        pipeline._ranking = MagicMock(return_value=[])
-        pipeline._budget_allocation = MagicMock(return_value=(sample_nodes, MagicMock(
+        pipeline._ranking = lambda *args, **kwargs: []
+        pipeline._budget_allocation = lambda *args, **kwargs: (sample_nodes, SimpleNamespace(
             total_tokens=100,
             budget_used_pct=50.0,
             nodes_truncated=0,
-            strategy_used=MagicMock(value="adaptive")
-        )))
+            strategy_used=SimpleNamespace(value="adaptive")
+        ))
         pipeline._summarization = AsyncMock(return_value=sample_nodes)
-        pipeline._final_formatting = MagicMock(return_value="formatted context")
+        pipeline._final_formatting = lambda *args, **kwargs: "formatted context"
 
         result = await pipeline.run(
             repo_id="test_repo",
@@ -124,15 +150,15 @@ class TestUnifiedContextPipeline:
         """Test pipeline run with entry points."""
         pipeline._semantic_search = AsyncMock(return_value=sample_search_results)
         pipeline._graph_expansion = AsyncMock(return_value=sample_nodes)
-        pipeline._ranking = MagicMock(return_value=[])
-        pipeline._budget_allocation = MagicMock(return_value=(sample_nodes, MagicMock(
+        pipeline._ranking = lambda *args, **kwargs: []
+        pipeline._budget_allocation = lambda *args, **kwargs: (sample_nodes, SimpleNamespace(
             total_tokens=100,
             budget_used_pct=50.0,
             nodes_truncated=0,
-            strategy_used=MagicMock(value="adaptive")
-        )))
+            strategy_used=SimpleNamespace(value="adaptive")
+        ))
         pipeline._summarization = AsyncMock(return_value=sample_nodes)
-        pipeline._final_formatting = MagicMock(return_value="formatted context")
+        pipeline._final_formatting = lambda *args, **kwargs: "formatted context"
 
         result = await pipeline.run(
             repo_id="test_repo",
@@ -177,36 +203,19 @@ class TestUnifiedContextPipeline:
         assert result[0].id == "func_a"
 
     @pytest.mark.asyncio
-    async def test_resolve_entry_point_file(self, pipeline, sample_nodes):
-        """Test resolving file entry point."""
-        pipeline.graph.get_nodes_in_file = AsyncMock(return_value=sample_nodes)
-
-        result = await pipeline._resolve_entry_point("test_repo", "test.py")
-
-        assert result == ["func_a"]
-
-    @pytest.mark.asyncio
-    async def test_resolve_entry_point_glob(self, pipeline, sample_nodes):
-        """Test resolving glob entry point."""
-        pipeline.graph.find_nodes_by_glob = AsyncMock(return_value=sample_nodes)
-
-        result = await pipeline._resolve_entry_point("test_repo", "*.py")
-
-        assert result == ["func_a"]
-
-    @pytest.mark.asyncio
-    async def test_resolve_entry_point_line_ref(self, pipeline, sample_nodes):
-        """Test resolving line reference entry point."""
-        pipeline.graph.get_node_at_line = AsyncMock(return_value=sample_nodes[0])
-
-        result = await pipeline._resolve_entry_point("test_repo", "test.py:10")
-
-        assert result == ["func_a"]
-
-    @pytest.mark.asyncio
-    async def test_resolve_entry_point_fqn(self, pipeline):
-        """Test resolving FQN entry point."""
-        result = await pipeline._resolve_entry_point("test_repo", "func_a")
+    @pytest.mark.parametrize("entry_point,method,single", [
+        ("test.py", "get_nodes_in_file", False),
+        ("*.py", "find_nodes_by_glob", False),
+        ("test.py:10", "get_node_at_line", True),
+        ("func_a", None, False),
+    ], ids=["file", "glob", "line_ref", "fqn"])
+    async def test_resolve_entry_point(self, pipeline, sample_nodes, entry_point, method, single):
+        """Test resolving file, glob, line reference and FQN entry points."""
+        if method:
+            return_value = sample_nodes[0] if single else sample_nodes
+            setattr(pipeline.graph, method, AsyncMock(return_value=return_value))
+
+        result = await pipeline._resolve_entry_point("test_repo", entry_point)
 
         assert result == ["func_a"]
 
@@ -222,12 +231,13 @@ class TestUnifiedContextPipeline:
     def test_budget_allocation_stage(self, pipeline, sample_nodes):
         """Test budget allocation stage."""
         # Mock budget allocator
-        mock_allocation = MagicMock()
-        mock_allocation.selected_nodes = sample_nodes
-        mock_allocation.total_tokens = 100
-        mock_allocation.budget_used_pct = 50.0
-        mock_allocation.nodes_truncated = 0
-        mock_allocation.strategy_used = MagicMock(value="adaptive")
+        mock_allocation = SimpleNamespace(
+            selected_nodes=sample_nodes,
+            total_tokens=100,
+            budget_used_pct=50.0,
+            nodes_truncated=0,
+            strategy_used=SimpleNamespace(value="adaptive")
+        )
 
         pipeline.budget_allocator.allocate = MagicMock(return_value=mock_allocation)
 
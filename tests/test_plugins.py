@@ -1,18 +1,20 @@
 """Tests for plugin system."""
 
 import pytest
+import yaml
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from src.codex_aura.plugins.registry import PluginRegistry
 from src.codex_aura.plugins.config import PluginConfig
-from src.codex_aura.plugins.builtin.context_basic import BasicContextPlugin
-from src.codex_aura.plugins.builtin.impact_basic import BasicImpactPlugin
 
 
 def test_plugin_registry():
     """Test that plugins are registered correctly."""
     # Import plugins to trigger registration
     from src.codex_aura.plugins import builtin  # noqa: F401
+    from src.codex_aura.plugins.builtin.context_basic import BasicContextPlugin
+    from src.codex_aura.plugins.builtin.impact_basic import BasicImpactPlugin
 
     # Check context plugins
     context_plugins = PluginRegistry.list_context_plugins()
@@ -48,11 +50,42 @@ def test_plugin_config():
     assert config.get_premium_plugin("impact") == "codex_aura_premium.impact_advanced"
 
 
+def test_plugin_config_parse_cache(tmp_path):
+    """Test that parsed plugin config is reused until the file changes."""
+    import os
+
+    config_path = tmp_path / "plugins.yaml"
+    config_path.write_text("plugins:\n  context:\n    default: basic\n")
+    PluginConfig.clear_cache()
+
+    with patch("src.codex_aura.plugins.config.yaml.load", wraps=yaml.load) as mock_load:
+        assert PluginConfig(config_path).get_context_plugin() == "basic"
+        assert PluginConfig(config_path).get_context_plugin() == "basic"
+        assert mock_load.call_count == 1
+
+        config_path.write_text("plugins:\n  context:\n    default: premium\n")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert PluginConfig(config_path).get_context_plugin() == "premium"
+        assert mock_load.call_count == 2
+
+
+def test_plugin_config_leaves_config_dir_untouched(tmp_path):
+    """Test that loading the config never writes files next to it."""
+    config_path = tmp_path / "plugins.yaml"
+    config_path.write_text("plugins:\n  context:\n    default: basic\n")
+    PluginConfig.clear_cache()
+
+    assert PluginConfig(config_path).get_context_plugin() == "basic"
+    assert [p.name for p in tmp_path.iterdir()] == ["plugins.yaml"]
+
+
 def test_basic_context_plugin():
     """Test BasicContextPlugin functionality."""
     from src.codex_aura.models.node import Node
+    from src.codex_aura.plugins import builtin  # noqa: F401
 
-    plugin = BasicContextPlugin()
+    plugin = PluginRegistry.get_context_plugin("basic")()
 
     # Create test nodes (without distance attributes - basic plugin handles this)
     nodes = [
@@ -85,8 +118,9 @@ def test_basic_impact_plugin():
     from src.codex_aura.models.node import Node
     from src.codex_aura.models.edge import Edge, EdgeType
     from datetime import datetime
+    from src.codex_aura.plugins import builtin  # noqa: F401
 
-    plugin = BasicImpactPlugin()
+    plugin = PluginRegistry.get_impact_plugin("basic")()
 
     # Create test graph
     nodes = [
@@ -126,20 +160,63 @@ def test_basic_impact_plugin():
 def test_plugin_discovery_entry_points():
     """Test plugin discovery through entry points."""
     # Get initial counts
-    initial_context = len(PluginRegistry._context_plugins)
-    initial_impact = len(PluginRegistry._impact_plugins)
+    initial_context, initial_impact = PluginRegistry.counts()
 
     # Discover plugins (should not duplicate existing ones)
     PluginRegistry.discover_plugins()
 
     # Check that plugins were discovered (at least the same count or more)
-    context_plugins = PluginRegistry.list_context_plugins()
-    impact_plugins = PluginRegistry.list_impact_plugins()
+    context_count, impact_count = PluginRegistry.counts()
+    assert context_count >= initial_context
+    assert impact_count >= initial_impact
+    assert PluginRegistry.get_context_plugin("basic") is not None
+    assert PluginRegistry.get_impact_plugin("basic") is not None
 
-    assert len(context_plugins) >= initial_context
-    assert len(impact_plugins) >= initial_impact
-    assert "basic" in context_plugins
-    assert "basic" in impact_plugins
+
+def test_plugin_discovery_is_cached():
+    """Test that repeated discovery does not rescan entry points."""
+    PluginRegistry.discover_plugins()
+    initial_counts = PluginRegistry.counts()
+
+    with patch("importlib.metadata.entry_points") as mock_entry_points:
+        PluginRegistry.discover_plugins()
+        mock_entry_points.assert_not_called()
+
+        PluginRegistry.discover_plugins(force=True)
+        assert mock_entry_points.call_count == 2
+
+    assert PluginRegistry.counts() == initial_counts
+
+
+def test_discovered_plugins_kept_apart_from_registered():
+    """Test that entry point plugins land in the discovered delta, not the registered dict."""
+    from src.codex_aura.plugins import builtin  # noqa: F401
+
+    class ExternalContextPlugin:
+        pass
+
+    entry_point = MagicMock(value="external:ExternalContextPlugin")
+    entry_point.name = "external"
+    entry_point.load.return_value = ExternalContextPlugin
+    builtin_context = dict(PluginRegistry._context_plugins)
+    initial_context, initial_impact = PluginRegistry.counts()
+
+    def entry_points(group):
+        return [entry_point] if group == "codex_aura.plugins.context" else []
+
+    try:
+        with patch("importlib.metadata.entry_points", side_effect=entry_points):
+            PluginRegistry.discover_plugins(force=True)
+
+        assert PluginRegistry._discovered_context["external"] is ExternalContextPlugin
+        assert PluginRegistry._context_plugins == builtin_context
+        assert PluginRegistry.get_context_plugin("external") is ExternalContextPlugin
+        assert PluginRegistry.counts() == (initial_context + 1, initial_impact)
+    finally:
+        PluginRegistry._discovered_context.pop("external", None)
+        PluginRegistry._invalidate("context", "external")
+
+    assert "external" not in PluginRegistry.list_context_plugins()
 
 
 def test_plugin_capabilities():
@@ -163,6 +240,13 @@ def test_plugin_capabilities():
     assert "capabilities" in impact_caps
     assert impact_caps["capabilities"]["transitive_analysis"] is True
 
+    # Repeated lookups are served from the cache and return independent copies
+    context_caps["capabilities"]["semantic_ranking"] = True
+    with patch.object(PluginRegistry.get_context_plugin("basic"), "get_capabilities") as mock_caps:
+        cached_caps = PluginRegistry.get_context_plugin_capabilities("basic")
+        mock_caps.assert_not_called()
+    assert cached_caps["capabilities"]["semantic_ranking"] is False
+
 
 def test_get_all_capabilities():
     """Test getting all plugin capabilities."""
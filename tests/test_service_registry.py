@@ -5,15 +5,6 @@ from uuid import uuid4
 
 from ..src.codex_aura.models.service import Service
 from ..src.codex_aura.storage.service_registry import ServiceRegistry
-from ..src.codex_aura.storage.sqlite import SQLiteStorage
-
-
-@pytest.fixture
-def db():
-    """Create a test database."""
-    db = SQLiteStorage(":memory:")
-    yield db
-    # Cleanup if needed
 
 
 @pytest.fixture
@@ -22,10 +13,9 @@ def service_registry(db):
     return ServiceRegistry(db)
 
 
-def test_register_service(service_registry):
+def test_register_service(service_registry, uuid_batch):
     """Test registering a new service."""
-    service_id = uuid4()
-    repo_id = uuid4()
+    service_id, repo_id = uuid_batch(2)
 
     service = Service(
         service_id=service_id,
@@ -45,10 +35,9 @@ def test_register_service(service_registry):
     assert retrieved.description == "Test service"
 
 
-def test_get_service_by_repo_id(service_registry):
+def test_get_service_by_repo_id(service_registry, uuid_batch):
     """Test getting service by repository ID."""
-    service_id = uuid4()
-    repo_id = uuid4()
+    service_id, repo_id = uuid_batch(2)
 
     service = Service(
         service_id=service_id,
@@ -65,36 +54,34 @@ def test_get_service_by_repo_id(service_registry):
     assert retrieved.name == "repo-service"
 
 
-def test_list_services(service_registry):
+def test_get_service_by_repo_id_returns_copies(service_registry, uuid_batch):
+    """Test that mutating a returned service leaves the cached lookup intact."""
+    service_id, repo_id = uuid_batch(2)
+    service_registry.register_service(
+        Service(service_id=service_id, name="cached", repo_id=repo_id)
+    )
+
+    first = service_registry.get_service_by_repo_id(str(repo_id))
+    first.name = "mutated"
+
+    assert service_registry.get_service_by_repo_id(str(repo_id)).name == "cached"
+
+
+def test_list_services(service_registry, uuid_batch):
     """Test listing all services."""
-    # Register multiple services
-    services = []
+    ids = uuid_batch(6)
     for i in range(3):
-        service_id = uuid4()
-        repo_id = uuid4()
-        service = Service(
-            service_id=service_id,
-            name=f"service-{i}",
-            repo_id=repo_id
+        service_registry.register_service(
+            Service(service_id=ids[2 * i], name=f"service-{i}", repo_id=ids[2 * i + 1])
         )
-        service_registry.register_service(service)
-        services.append(service)
 
-    # List all services
-    listed = service_registry.list_services()
-    assert len(listed) >= 3
+    service_names = {s.name for s in service_registry.list_services()}
+    assert service_names == {"service-0", "service-1", "service-2"}
 
-    # Check that our services are in the list
-    service_names = {s.name for s in listed}
-    assert "service-0" in service_names
-    assert "service-1" in service_names
-    assert "service-2" in service_names
 
-
-def test_delete_service(service_registry):
+def test_delete_service(service_registry, uuid_batch):
     """Test deleting a service."""
-    service_id = uuid4()
-    repo_id = uuid4()
+    service_id, repo_id = uuid_batch(2)
 
     service = Service(
         service_id=service_id,
@@ -115,10 +102,9 @@ def test_delete_service(service_registry):
     assert service_registry.get_service_by_id(str(service_id)) is None
 
 
-def test_get_service_name_by_repo_id(service_registry):
+def test_get_service_name_by_repo_id(service_registry, uuid_batch):
     """Test getting service name by repository ID."""
-    service_id = uuid4()
-    repo_id = uuid4()
+    service_id, repo_id = uuid_batch(2)
 
     service = Service(
         service_id=service_id,
@@ -137,10 +123,32 @@ def test_get_service_name_by_repo_id(service_registry):
     assert name is None
 
 
-def test_service_uuid_validation():
+def test_repo_id_lookup_cached_until_invalidated(service_registry, uuid_batch, monkeypatch):
+    """Test that repo_id lookups are cached and dropped on register/delete."""
+    service_id, repo_id = uuid_batch(2)
+
+    # A miss is cached too, and registering the repo invalidates it
+    assert service_registry.get_service_by_repo_id(str(repo_id)) is None
+    service_registry.register_service(
+        Service(service_id=service_id, name="cached", repo_id=repo_id)
+    )
+    assert service_registry.get_service_name_by_repo_id(str(repo_id)) == "cached"
+
+    calls = []
+    original = service_registry.db.get_service_by_repo_id
+    monkeypatch.setattr(service_registry.db, "get_service_by_repo_id",
+                        lambda rid: calls.append(rid) or original(rid))
+    assert service_registry.get_service_name_by_repo_id(str(repo_id)) == "cached"
+    assert calls == []
+
+    service_registry.delete_service(str(service_id))
+    assert service_registry.get_service_by_repo_id(str(repo_id)) is None
+    assert calls == [str(repo_id)]
+
+
+def test_service_uuid_validation(uuid_batch):
     """Test UUID validation in Service model."""
-    service_id = uuid4()
-    repo_id = uuid4()
+    service_id, repo_id = uuid_batch(2)
 
     # Test with UUID objects
     service = Service(
@@ -1,31 +1,30 @@
 """Unit tests for SQLite storage backend."""
 
-import pytest
-import tempfile
+import sqlite3
 from datetime import datetime
-from pathlib import Path
+from uuid import uuid4
+
+import pytest
 
+from src.codex_aura.models.edge import Edge, EdgeType
 from src.codex_aura.models.graph import Graph, Repository, Stats
 from src.codex_aura.models.node import Node
-from src.codex_aura.models.edge import Edge, EdgeType
 from src.codex_aura.storage.sqlite import SQLiteStorage
 
 
 @pytest.fixture
 def temp_db():
-    """Create a temporary database for testing."""
-    db_path = tempfile.mktemp(suffix='.db')
-    yield db_path
-    # Try to remove file, ignore if locked
-    try:
-        Path(db_path).unlink(missing_ok=True)
-    except PermissionError:
-        pass  # File still in use, will be cleaned up later
+    """Create an isolated shared-cache in-memory database URI for testing."""
+    return f"file:mem_{uuid4().hex}?mode=memory&cache=shared"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_graph():
-    """Create a sample graph for testing."""
+    """Create a sample graph once per module.
+
+    Tests only pass it to save_graph, so it is shared without copying; a test
+    that mutates it should take ``sample_graph.model_copy(deep=True)``.
+    """
     nodes = [
         Node(id="main.py", type="file", name="main.py", path="main.py"),
         Node(id="utils.py", type="file", name="utils.py", path="utils.py"),
@@ -78,7 +77,7 @@ def test_sqlite_save_load(temp_db, sample_graph):
     # Verify edge data
     loaded_edges = [(e.source, e.target, e.type.value) for e in loaded_graph.edges]
     original_edges = [(e.source, e.target, e.type.value) for e in sample_graph.edges]
-    assert set(loaded_edges) == set(original_edges)
+    assert sorted(loaded_edges) == sorted(original_edges)
 
 
 def test_sqlite_query_nodes(temp_db, sample_graph):
@@ -163,6 +162,50 @@ def test_sqlite_query_dependencies(temp_db, sample_graph):
     assert "utils.py::Config" in node_ids
 
 
+def _cycle_graph():
+    """A five-node graph with a cycle, built without the sample_graph fixture."""
+    ids = ["a", "b", "c", "d", "e"]
+    edges = [
+        Edge(source="a", target="b", type=EdgeType.CALLS),
+        Edge(source="b", target="c", type=EdgeType.IMPORTS),
+        Edge(source="c", target="a", type=EdgeType.CALLS),
+        Edge(source="c", target="d", type=EdgeType.CALLS),
+        Edge(source="e", target="b", type=EdgeType.CALLS),
+    ]
+    return Graph(
+        version="0.1",
+        generated_at=datetime.now(),
+        repository=Repository(path="/test/repo", name="test-repo", user_id="user"),
+        stats=Stats(total_nodes=len(ids), total_edges=len(edges), node_types={"file": len(ids)}),
+        nodes=[Node(id=i, type="file", name=i, path=i) for i in ids],
+        edges=edges
+    )
+
+
+@pytest.mark.parametrize("direction", ["incoming", "outgoing", "both"])
+@pytest.mark.parametrize("edge_types", [None, ["CALLS"]])
+def test_sqlite_query_dependencies_matches_traversal(temp_db, direction, edge_types):
+    """Test that the SQL traversal agrees with the in-memory BFS, cycles included."""
+    graph = _cycle_graph()
+    storage = SQLiteStorage(db_path=temp_db)
+    storage.save_graph(graph, "cycle")
+
+    for max_depth in range(4):
+        assert storage.query_dependencies("cycle", "b", direction, max_depth, edge_types) == \
+            storage._traverse_dependencies(graph, "b", max_depth, direction, edge_types)
+
+
+def test_sqlite_list_graphs_reads_stats(temp_db):
+    """Test that listed graphs report stats without loading the graph."""
+    graph = _cycle_graph()
+    storage = SQLiteStorage(db_path=temp_db)
+    storage.save_graph(graph, "cycle")
+
+    [listed] = storage.list_graphs(repo_path="/test/repo")
+    assert (listed["id"], listed["node_count"], listed["edge_count"]) == ("cycle", 5, 5)
+    assert listed["created_at"] == graph.generated_at
+
+
 def test_sqlite_list_graphs(temp_db, sample_graph):
     """Test listing graphs."""
     storage = SQLiteStorage(db_path=temp_db)
@@ -225,6 +268,47 @@ def test_sqlite_migrations(temp_db):
     pass
 
 
+def test_sqlite_list_graphs_uses_index(temp_db):
+    """Test that filtering graphs by repo path is served by the composite index."""
+    storage = SQLiteStorage(db_path=temp_db)
+    assert storage._get_schema_version() == 3
+
+    with storage._get_connection() as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM graphs WHERE repo_path = ? ORDER BY created_at DESC",
+            ("/test/repo",)
+        ).fetchall()
+    assert any("idx_graphs_repo_path_created" in row[-1] for row in plan)
+
+
+@pytest.mark.parametrize("in_memory", [False, True])
+def test_sqlite_backend_shares_uri_and_memory_databases(temp_db, tmp_path, monkeypatch, in_memory):
+    """Test that helper connections reach the storage's own database, not a stray file."""
+    from src.codex_aura.storage.storage_abstraction import SQLiteStorageBackend
+
+    monkeypatch.chdir(tmp_path)
+    backend = SQLiteStorageBackend(":memory:" if in_memory else temp_db)
+
+    with backend.storage._get_connection() as conn:
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        tables = {row[0] for row in rows}
+    assert {"nodes", "edges", "graphs"} <= tables
+    assert list(tmp_path.iterdir()) == []
+
+    backend.storage.close()
+
+
+def test_sqlite_file_database_uses_wal(tmp_path):
+    """Test that on-disk databases open in WAL mode with relaxed syncing."""
+    storage = SQLiteStorage(db_path=str(tmp_path / "wal.db"))
+
+    with storage._get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    storage.close()
+
+
 def test_sqlite_nonexistent_graph(temp_db):
     """Test operations on nonexistent graphs."""
     storage = SQLiteStorage(db_path=temp_db)
@@ -239,4 +323,72 @@ def test_sqlite_nonexistent_graph(temp_db):
         storage.query_edges("nonexistent")
 
     with pytest.raises(Exception):
-        storage.query_dependencies("nonexistent", "node1")
\ No newline at end of file
+        storage.query_dependencies("nonexistent", "node1")
+
+
+def test_sqlite_memory_database_persists_across_calls():
+    """Test that an in-memory database keeps its schema and data between calls."""
+    from src.codex_aura.models.service import Service
+
+    storage = SQLiteStorage(db_path=":memory:")
+    service = Service(service_id=uuid4(), name="memory-service", repo_id=uuid4())
+
+    storage.save_service(service)
+    assert storage.get_service_by_id(str(service.service_id)).name == "memory-service"
+    with storage._get_connection() as first, storage._get_connection() as second:
+        assert first is second
+
+    storage.close()
+
+
+def test_sqlite_memory_database_serializes_threads():
+    """Test that concurrent writers on the shared in-memory connection do not interleave."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src.codex_aura.models.service import Service
+
+    with SQLiteStorage(db_path=":memory:") as storage:
+        def register(i):
+            storage.save_service(Service(service_id=uuid4(), name=f"service-{i}", repo_id=uuid4()))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(register, range(200)))
+
+        assert len(storage.list_services()) == 200
+
+
+def test_sqlite_file_database_closes_from_another_thread(tmp_path):
+    """Test that close() releases connections opened on worker threads."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    storage = SQLiteStorage(db_path=str(tmp_path / "threads.db"))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: storage.list_graphs(), range(8)))
+    connections = list(storage._connections)
+    assert len(connections) > 1
+
+    storage.close()
+
+    assert storage._connections == []
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_sqlite_shared_memory_uri_isolated(temp_db):
+    """Test that a shared-cache memory URI is visible across connections but not other URIs."""
+    from src.codex_aura.models.service import Service
+
+    storage = SQLiteStorage(db_path=temp_db)
+    service = Service(service_id=uuid4(), name="uri-service", repo_id=uuid4())
+    storage.save_service(service)
+
+    # A second storage on the same URI sees the same database
+    same = SQLiteStorage(db_path=temp_db)
+    assert same.get_service_by_id(str(service.service_id)).name == "uri-service"
+
+    other = SQLiteStorage(db_path=f"file:mem_{uuid4().hex}?mode=memory&cache=shared")
+    assert other.get_service_by_id(str(service.service_id)) is None
+
+    for s in (storage, same, other):
+        s.close()